@@ -2,7 +2,7 @@ import numpy as np
 cimport numpy as cnp
 cimport cython
 from libc.stdlib cimport rand, srand, malloc
-from libc.math cimport sqrt, isnan
+from libc.math cimport isnan
 from numpy.random cimport bitgen_t
 from numpy.random import SFC64, Generator
 from cpython.pycapsule cimport PyCapsule_IsValid, PyCapsule_GetPointer
@@ -95,58 +95,6 @@ cpdef void mixupnd(cnp.ndarray arr, int obs_axis, float alpha=1.0,
         raise ValueError("Cannot apply mixup to a 1-dimensional array")
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef inline void norm1d(double[:] arr):
-    cdef Py_ssize_t i
-    cdef cnp.ndarray[cnp.uint8_t, ndim = 1, cast=True] wh
-    cdef Py_ssize_t[::1] wh_iter
-    cdef double mean, std, sum, var
-
-    # Get indices of rows with NaN values
-    wh = np.isnan(arr)
-    wh_iter = np.flatnonzero(~wh)
-
-    # Check if there are at least two non-NaN rows
-    if wh_iter.shape[0] < 1:
-        raise ValueError("No test data to fit distribution")
-
-    # Calculate mean and standard deviation for each column
-    sum = 0
-    var = 0
-    for i in wh_iter:
-        sum += arr[i]
-    mean = sum / wh_iter.shape[0]
-    for i in wh_iter:
-        var += (arr[i] - mean) ** 2
-    std = sqrt(var / wh_iter.shape[0])
-
-    # Get the normal distribution of each timepoint
-    for i in range(arr.shape[0]):
-        if wh[i]:
-            arr[i] = np.random.normal(mean, std)
-
-
-@cython.boundscheck(False)
-cpdef void normnd(cnp.ndarray arr, int obs_axis=-1):
-    cdef cnp.ndarray arr_in
-
-    # create a view of the array with the observation axis in the last position
-    if obs_axis != -1:
-        arr_in = np.swapaxes(arr, obs_axis, -1)
-    else:
-        arr_in = arr
-
-    if arr.ndim == 1:
-        norm1d(arr_in)
-    elif arr.ndim > 1:
-        for i in range(arr_in.shape[0]):
-            # Ensure that the last two dimensions are free
-            normnd(arr_in[i], -1)
-    else:
-        raise ValueError("Cannot apply norm to a 0-dimensional array")
-
-
 cdef class RNG:
     cdef bitgen_t *rng
     cdef object bit_generator
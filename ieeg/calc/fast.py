@@ -1,8 +1,7 @@
 import numpy as np
 from ieeg.calc._fast.ufuncs import mean_diff as _md
-from ieeg.calc._fast.mixup import mixupnd as cmixup, normnd as cnorm
+from ieeg.calc._fast.mixup import mixupnd as cmixup
 from ieeg.calc._fast.permgt import permgtnd as permgt
-from ieeg.calc._fast.concat import nan_concatinate
 
 __all__ = ["mean_diff", "mixup", "permgt", "norm", "concatenate_arrays"]
 
@@ -58,12 +57,36 @@ def concatenate_arrays(arrays: tuple[np.ndarray, ...], axis: int = 0
         axis = 0
         arrays = [np.expand_dims(ar, axis) for ar in arrays]
 
-    arrays = [ar.astype(float) for ar in arrays if ar.size > 0]
+    arrays = [ar for ar in arrays if ar.size > 0]
+    n_dim = max(a.ndim for a in arrays)
 
     while axis < 0:
-        axis += max(a.ndim for a in arrays)
-
-    return nan_concatinate(arrays, axis)
+        axis += n_dim
+
+    if n_dim == 0:
+        return np.concatenate(arrays)
+    assert n_dim > axis, "Axis out of bounds."
+
+    # missing trailing dimensions are treated as length 1
+    shapes = [ar.shape + (1,) * (n_dim - ar.ndim) for ar in arrays]
+    out_shape = [max(s[i] for s in shapes) for i in range(n_dim)]
+    out_shape[axis] = sum(s[axis] for s in shapes)
+    if all(ar.ndim == n_dim for ar in arrays) and all(
+            s[:axis] + s[axis + 1:] == shapes[0][:axis] + shapes[0][axis + 1:]
+            for s in shapes):
+        return np.concatenate(arrays, axis, dtype=float)
+
+    # fill a single preallocated output, casting to float on assignment
+    out = np.full(out_shape, np.nan)
+    start = 0
+    for ar, shape in zip(arrays, shapes):
+        stop = start + shape[axis]
+        idx = tuple(slice(start, stop) if i == axis else slice(n)
+                    for i, n in enumerate(shape))
+        out[idx] = ar.reshape(shape)
+        start = stop
+
+    return out
 
 
 def mixup(arr: np.ndarray, obs_axis: int, alpha: float = 1.,
@@ -118,17 +141,21 @@ def mixup(arr: np.ndarray, obs_axis: int, alpha: float = 1.,
             [20.        , 21.        , 22.        , 23.        ]]])
     """
 
-    if arr.ndim > 3:
-        for i in range(arr.shape[0]):
-            mixup(arr[i], obs_axis - 1, alpha, seed)
-    elif arr.ndim == 1:
+    if arr.ndim == 1:
         raise ValueError("Array must have at least 2 dimensions")
+    if seed is None:
+        seed = np.random.randint(0, 2 ** 16 - 1)
+
+    # move the observations to the second to last axis and merge the leading
+    # axes into a single batch axis so cmixup handles every slice in one call
+    arr_in = np.moveaxis(arr, obs_axis, -2)
+    if arr_in.ndim > 3:
+        batch = arr_in.reshape(-1, *arr_in.shape[-2:])
+        cmixup(batch, -2, alpha, seed)
+        if not np.may_share_memory(batch, arr):  # reshape had to copy
+            arr_in[...] = batch.reshape(arr_in.shape)
     else:
-        if seed is None:
-            seed = np.random.randint(0, 2 ** 16 - 1)
-        if obs_axis == 0:
-            arr = arr.swapaxes(1, obs_axis)
-        cmixup(arr, 1, alpha, seed)
+        cmixup(arr_in, -2, alpha, seed)
 
 
 def norm(arr: np.ndarray, obs_axis: int = -1) -> None:
@@ -151,7 +178,17 @@ def norm(arr: np.ndarray, obs_axis: int = -1) -> None:
     array([1.        , 2.        , 4.        , 5.        , 7.        ,
            8.        , 8.91013086, 5.50039302])
     """
-    cnorm(arr, obs_axis)
+    # swapaxes, like the old kernel, keeps seeded draws in the same order
+    arr_in = np.swapaxes(arr, obs_axis, -1)
+    nans = np.isnan(arr_in)
+    if np.any(nans.all(axis=-1)):
+        raise ValueError("No test data to fit distribution")
+
+    # Get the normal distribution of each timepoint
+    idx = np.nonzero(nans)
+    mean = np.nanmean(arr_in, axis=-1)[idx[:-1]]
+    std = np.nanstd(arr_in, axis=-1)[idx[:-1]]
+    arr_in[idx] = np.random.normal(mean, std, idx[-1].shape)
 
 
 def mean_diff(group1: np.ndarray, group2: np.ndarray,
@@ -188,10 +225,5 @@ def mean_diff(group1: np.ndarray, group2: np.ndarray,
     """
     assert group1.ndim == group2.ndim, ("Arrays must have the same number of"
                                         "dimensions")
-    if group1.ndim > 1 and axis not in (group1.ndim - 1, -1):
-        in1 = np.moveaxis(group1, axis, -1)
-        in2 = np.moveaxis(group2, axis, -1)
-    else:
-        in1, in2 = group1, group2
-
-    return _md(in1, in2)
+    # let the gufunc pick its core axis instead of building moved views
+    return _md(group1, group2, axes=[(axis,), (axis,), ()])
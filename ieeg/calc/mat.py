@@ -1,5 +1,6 @@
 import functools
 from collections.abc import Iterable
+from numbers import Number
 
 import mne
 from ieeg.calc.fast import concatenate_arrays
@@ -9,6 +10,10 @@ from numpy.typing import ArrayLike
 
 import ieeg
 
+# the types np.isscalar accepts, checked directly while walking nested dicts
+_SCALAR_TYPES = (int, float, complex, str, bytes, memoryview, np.generic,
+                 Number)
+
 
 def iter_nest_dict(d: dict, _lvl: int = 0, _coords=()):
     """Iterate over a nested dictionary, yielding the key and value.
@@ -33,14 +38,27 @@ def iter_nest_dict(d: dict, _lvl: int = 0, _coords=()):
     ('d', 'e') 3
     ('d', 'f') 4
     """
-    for k, v in d.items():
-        if isinstance(v, dict):
-            yield from iter_nest_dict(v, _lvl + 1, _coords + (k,))
-        elif isinstance(v, np.ndarray):
-            yield from iter_nest_dict({i: val for i, val in enumerate(v)
-                                       }, _lvl + 1, _coords + (k,))
+    # one (coords, items) pair per open level, arrays are walked by index
+    stack = [(_coords, iter(d.items()))]
+    while stack:
+        coords, items = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((coords + (k,), iter(v.items())))
+                break
+            elif isinstance(v, np.ndarray) and v.dtype == object:
+                stack.append((coords + (k,), enumerate(v)))
+                break
+            elif isinstance(v, np.ndarray):
+                # numeric arrays hold no further levels, so yield their
+                # elements without a stack entry per row
+                key = coords + (k,)
+                for idx, x in zip(np.ndindex(v.shape), v.flat):
+                    yield key + idx, x
+            else:
+                yield coords + (k,), v
         else:
-            yield _coords + (k,), v
+            stack.pop()
 
 
 def lcs(*strings: str) -> str:
@@ -69,18 +87,29 @@ def lcs(*strings: str) -> str:
         return ""
 
     def _lcs_two_strings(s1, s2):
+        # a string contained in the other is the longest possible match
+        if s1 in s2:
+            return s1
+        elif s2 in s1:
+            return s2
+
         n, m = len(s1), len(s2)
-        dp = [[0] * (m + 1) for _ in range(n + 1)]
+        if n * m > 4096:
+            return _lcs_rows(s1, s2)
+        prev = [0] * (m + 1)
         max_len = 0
         end_pos = 0
 
         for i in range(1, n + 1):
+            cur = [0] * (m + 1)
+            c1 = s1[i - 1]
             for j in range(1, m + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                    if dp[i][j] > max_len:
-                        max_len = dp[i][j]
+                if c1 == s2[j - 1]:
+                    cur[j] = prev[j - 1] + 1
+                    if cur[j] > max_len:
+                        max_len = cur[j]
                         end_pos = i
+            prev = cur
 
         return s1[end_pos - max_len:end_pos]
 
@@ -93,6 +122,29 @@ def lcs(*strings: str) -> str:
     return common_substr
 
 
+def _lcs_rows(s1: str, s2: str) -> str:
+    """Longest common substring of two long strings, one DP row at a time.
+
+    Each row of the dynamic program is computed with numpy over all of s2,
+    which outpaces the pure python loop once the strings are long.
+    """
+    n, m = len(s1), len(s2)
+    eq = np.fromiter(map(ord, s1), np.uint32, n)[:, None] == np.fromiter(
+        map(ord, s2), np.uint32, m)
+    prev = np.zeros(m + 1, np.intp)
+    cur = np.zeros(m + 1, np.intp)
+    max_len = 0
+    end_pos = 0
+    for i in range(n):
+        np.multiply(prev[:-1] + 1, eq[i], out=cur[1:])
+        row_max = int(cur.max())
+        if row_max > max_len:
+            max_len = row_max
+            end_pos = i + 1
+        prev, cur = cur, prev
+    return s1[end_pos - max_len:end_pos]
+
+
 class LabeledArray(np.ndarray):
     """ A numpy array with labeled dimensions, acting like a dictionary.
 
@@ -240,8 +292,11 @@ class LabeledArray(np.ndarray):
         super(LabeledArray, self).__setstate__(state[0:-1])
 
     def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
-        la_inputs = (i for i in inputs if isinstance(i, LabeledArray))
-        labels = next(la_inputs).labels.copy()
+        for i in inputs:
+            if isinstance(i, LabeledArray):
+                # only the outer list is edited below, so copy it shallowly
+                labels = list(i.labels)
+                break
         inputs = tuple(i.view(np.ndarray) if isinstance(i, LabeledArray)
                        else i for i in inputs)
         if out is not None:
@@ -249,28 +304,31 @@ class LabeledArray(np.ndarray):
                                   isinstance(o, LabeledArray)
                                   else o for o in out)
         if method == 'reduce':
-            axis = kwargs.get('axis', None)
+            ndim = inputs[0].ndim
+            # ufunc.reduce defaults to the first axis
+            axis = kwargs.get('axis', 0)
             if axis is None:
-                axis = range(inputs[0].ndim)
-            elif np.isscalar(axis):
-                axis = (axis,)
-            else:
-                axis = tuple(axis)
-            i = 0
-            for ax in axis:
-                if ax > 0:
-                    ax -= i
-                labels = list(labels)
-                if kwargs.get('keepdims', False):
+                axis = range(ndim)
+            axis = np._core.numeric.normalize_axis_tuple(axis, ndim)
+            if kwargs.get('keepdims', False):
+                for ax in axis:
                     labels[ax] = ("-".join(labels[ax]),)
-                else:
+            else:
+                # pop from the back so the axes left to pop keep their place
+                for ax in sorted(axis, reverse=True):
                     labels.pop(ax)
-                    i += 1
-                labels = tuple(labels)
 
         outputs = super(LabeledArray, self).__array_ufunc__(
             ufunc, method, *inputs, **kwargs)
-        if isinstance(outputs, tuple):
+        if method == '__call__' and out is None and isinstance(
+                outputs, np.ndarray) and outputs.shape == tuple(
+                map(len, labels)):
+            # elementwise results keep the input labels as they are, so
+            # there is nothing to rebuild or check
+            outputs = outputs.view(LabeledArray)
+            outputs.labels = labels
+            return outputs
+        elif isinstance(outputs, tuple):
             outputs = tuple(LabeledArray(o, labels)
                             if isinstance(o, np.ndarray)
                             else o for o in outputs)
@@ -326,8 +384,7 @@ class LabeledArray(np.ndarray):
                ['c', 'e'])
         """
 
-        arr = inner_array(data)
-        keys = inner_all_keys(data)
+        arr, keys = _flatten_dict(data)
         return cls(arr, keys, **kwargs)
 
     @classmethod
@@ -414,8 +471,8 @@ class LabeledArray(np.ndarray):
         dim = 0
         newaxis_count = 0
         for i, key in enumerate(keys):
-            key_type = type(key)
-            if np.issubdtype(key_type, str):
+            kind = _key_kind(type(key))
+            if kind is _STR:
                 key = self.labels[dim - newaxis_count].find(key)
                 keys[i] = key  # set original keys as well
             elif key is Ellipsis:
@@ -423,28 +480,45 @@ class LabeledArray(np.ndarray):
                 while dim < num_ellipsis_dims:
                     dim += 1
                 continue
-            elif key_type is slice:
+            elif kind is _SLICE:
                 key = new_keys[dim][key]
             elif key is np.newaxis or key is None:
                 new_keys.insert(dim, None)
                 newaxis_count += 1
                 dim += 1
                 continue
-            elif (key_type in (list, tuple) or
-                  np.issubdtype(key_type, np.ndarray)):
+            elif kind is _SEQ and isinstance(key, np.ndarray) and \
+                    key.dtype.kind in 'iu':
+                pass  # integer arrays hold no labels to resolve
+            elif kind is _SEQ and isinstance(key, np.ndarray) and \
+                    key.dtype.kind in 'fc':
+                raise TypeError(f"Unexpected key type: {key.dtype} array")
+            elif kind is _SEQ:
+                labels = self.labels[dim - newaxis_count]
                 key = list(key)
+                # one table serves every key, and is dropped afterwards so
+                # later writes to the labels can't leave it stale
+                positions = labels._label_positions() if labels.ndim == 1 \
+                    and len(key) > 1 else {}
+                found = 0
                 for j, k in enumerate(key):
-                    if np.issubdtype(type(k), str):
-                        key[j] = self.labels[dim - newaxis_count].find(k)
-                if np.issubdtype(key_type, np.ndarray):
-                    keys[i] = np.array(key)
+                    if isinstance(k, str):
+                        # unique labels resolve straight from the table
+                        pos = positions.get(k.rstrip(), ())
+                        if len(pos) == 1:
+                            key[j] = pos[0]
+                            found += 1
+                        else:
+                            key[j] = labels.find(k)
+                if found and found == len(key):  # all plain ints
+                    keys[i] = np.fromiter(key, np.intp, found)
                 else:
-                    keys[i] = key_type(key)
+                    keys[i] = np.array(key)
             elif np.isscalar(key):  # key should be an int
                 while key < 0:
                     key += self.shape[dim - newaxis_count]
             else:
-                raise TypeError(f"Unexpected key type: {key_type}")
+                raise TypeError(f"Unexpected key type: {type(key)}")
 
             new_keys[dim] = key
             dim += 1
@@ -470,6 +544,22 @@ class LabeledArray(np.ndarray):
             return tuple(keys), tuple(l_keys)
 
     def __getitem__(self, orig_keys):
+        if isinstance(orig_keys, str) and self.ndim > 0:
+            # a label that occurs once on the first axis is just an int
+            pos = np.flatnonzero(self.labels[0] == orig_keys)
+            if len(pos) == 1:
+                orig_keys = int(pos[0])
+
+        # ints and slices index one axis each, so the labels follow without
+        # parsing the keys
+        basic = orig_keys if type(orig_keys) is tuple else (orig_keys,)
+        if len(basic) <= self.ndim and all(map(_is_basic_key, basic)):
+            out = super(LabeledArray, self).__getitem__(orig_keys)
+            if isinstance(out, np.ndarray):
+                out.labels = [lab[k] for lab, k in zip(self.labels, basic)
+                              if type(k) is slice] + self.labels[len(basic):]
+            return out
+
         keys, label_keys = self._to_coords(orig_keys)
         out = super(LabeledArray, self).__getitem__(keys)
         if out.ndim == 0:
@@ -490,6 +580,11 @@ class LabeledArray(np.ndarray):
                 raise IndexError(f"Too many indices for array: "
                                  f"array is {out.ndim}-dimensional, "
                                  f"but {i + 1} were indexed")
+            elif isinstance(label_key, range) and \
+                    label_key == range(len(self.labels[i - j])):
+                # the whole axis is kept, so share its labels along with
+                # their cached lookup table
+                new_labels[i - k] = self.labels[i - j]
             else:
                 if isinstance(label_key, tuple):
                     label_key = np.asarray(label_key)
@@ -527,17 +622,20 @@ class LabeledArray(np.ndarray):
 
     def memory(self):
         size = self.nbytes
-        for unit in ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB']:
-            if size < 1024.0 or unit == 'PiB':
-                break
-            size /= 1024.0
-        return size, unit
+        # each unit is 2 ** 10 times the last, so the bit length picks it
+        shift = min((size.bit_length() - 1) // 10, 5) if size else 0
+        if shift:
+            size /= 1 << (10 * shift)
+        return size, ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB')[shift]
 
     def __eq__(self, other):
         if isinstance(other, LabeledArray):
-            return np.array_equal(self, other, True) and \
+            # the shape and labels are far smaller than the data, so check
+            # them first
+            return self.shape == other.shape and \
                 all(np.array_equal(l1, l2) for l1, l2 in zip(self.labels,
-                                                             other.labels))
+                                                             other.labels)) \
+                and np.array_equal(self.__array__(), other.__array__(), True)
         else:
             return self.__array__().__eq__(other)
 
@@ -546,15 +644,8 @@ class LabeledArray(np.ndarray):
 
     def to_dict(self) -> dict:
         """Convert to a dictionary."""
-        out = {}
-        for k, v in self.items():
-            if len(self.labels) > 1:
-                out[k] = v.to_dict()
-            elif np.isnan(v).all():
-                continue
-            else:
-                out[k] = v
-        return out
+        arr = self.__array__()
+        return _to_dict(arr, self.labels, np.isnan(arr))
 
     def items(self):
         return zip(self.keys(), self.values())
@@ -563,7 +654,16 @@ class LabeledArray(np.ndarray):
         return (lab for lab in self.labels[0])
 
     def values(self):
-        return (a for a in self)
+        arr = self.__array__()
+        if arr.ndim == 1:
+            yield from arr
+            return
+        # label each row directly rather than indexing through __getitem__
+        sub_labels = self.labels[1:]
+        for row in arr:
+            out = row.view(LabeledArray)
+            out.labels = list(sub_labels)
+            yield out
 
     def _reshape(self, shape, order='C') -> 'LabeledArray':
         """Reshape the array.
@@ -636,7 +736,8 @@ class LabeledArray(np.ndarray):
         Returns
         -------
         LabeledArray
-            The combined LabeledArray
+            The combined LabeledArray. Like `np.reshape`, this is a view of
+            the original data whenever no copy is needed.
 
         Examples
         --------
@@ -667,19 +768,19 @@ class LabeledArray(np.ndarray):
         assert levels[0] >= 0, "first level must be >= 0"
         assert levels[1] > levels[0], "second level must be > first level"
 
-        new_labels = list(self.labels).copy()
-        new_labels.pop(levels[0])
-
-        new_labels[levels[1] - 1] = (
-                self.labels[levels[0]] @ self.labels[levels[1]]).flatten()
+        lo, hi = levels
+        new_labels = list(self.labels)
+        new_labels.pop(lo)
 
-        all_idx = ([slice(None) if i != levels[0] else sl for i in
-                    range(self.ndim)] for sl in range(self.shape[levels[0]]))
+        new_labels[hi - 1] = (self.labels[lo] @ self.labels[hi]).flatten()
 
-        arrs = [self.__array__()[tuple(idx)] for idx in all_idx]
-        new_array = concatenate_arrays(arrs, axis=levels[1] - 1)
+        # move the first level next to the second and merge the two, which
+        # needs no copy when they are already adjacent and contiguous
+        arr = np.moveaxis(self.__array__(), lo, hi - 1)
+        shape = arr.shape[:hi - 1] + (arr.shape[hi - 1] * arr.shape[hi],) \
+            + arr.shape[hi + 1:]
 
-        return LabeledArray(new_array, new_labels, dtype=self.dtype)
+        return LabeledArray(arr.reshape(shape), new_labels)
 
     def take(self, indices, axis=None, **kwargs):
         """Take elements from an array along an axis.
@@ -760,16 +861,24 @@ class LabeledArray(np.ndarray):
                ['0', '1']
                ['0', '1'])
         """
+        arr = self.__array__()
+        # reduce the nan mask one trailing axis at a time, so that entry i
+        # only has axes 0 to i left and the full mask is traversed once
+        trailing = [np.isnan(arr)]
+        for _ in range(self.ndim - 1):
+            trailing.append(trailing[-1].all(axis=-1))
+        trailing.reverse()
         new_labels = list(self.labels)
-        idx = []
+        out = arr
         for i in range(self.ndim):
-            axes = tuple(j for j in range(self.ndim) if j != i)
-            mask = np.all(np.isnan(np.array(self)), axis=axes)
-            if np.any(mask):
-                new_labels[i] = tuple(np.array(new_labels[i])[~mask])
-            idx.append(~mask)
-        index = np.ix_(*idx)
-        return self[index]
+            keep = ~trailing[i].all(axis=tuple(range(i)))
+            # drop one axis at a time, skipping axes with nothing to drop
+            if not keep.all():
+                new_labels[i] = self.labels[i][keep]
+                out = np.compress(keep, out, axis=i)
+        if out is arr:
+            out = arr.copy()
+        return LabeledArray(out, new_labels)
 
     def concatenate(self, other: 'LabeledArray', axis: int = 0,
                     mismatch: str = 'raise', **kwargs) -> 'LabeledArray':
@@ -881,10 +990,57 @@ class LabeledArray(np.ndarray):
                 raise ValueError("Unexpected error")
 
         reordered = other.__array__()[tuple(idx)]
+        if 'dtype' not in kwargs and 'out' not in kwargs:
+            # cast while concatenating rather than copying the result again
+            kwargs.update(dtype=self.dtype, casting='unsafe')
         out = np.concatenate((self.__array__(), reordered), axis, **kwargs)
         return LabeledArray(out, new_labels, dtype=self.dtype)
 
 
+_STR, _SLICE, _SEQ, _OTHER = 'str', 'slice', 'seq', 'other'
+_KEY_KINDS: dict[type, str] = {str: _STR, np.str_: _STR, slice: _SLICE,
+                               list: _SEQ, tuple: _SEQ, np.ndarray: _SEQ,
+                               int: _OTHER, np.int64: _OTHER}
+
+
+def _key_kind(key_type: type) -> str:
+    """Classify an index key type for LabeledArray._parse_index.
+
+    The result is cached per type, so the numpy dtype checks only run the
+    first time a type is seen. Any type numpy would store as an object
+    (lists, tuples, arrays, ranges...) is a sequence of keys, except for
+    unordered containers such as dicts and sets.
+    """
+    kind = _KEY_KINDS.get(key_type)
+    if kind is None:
+        if issubclass(key_type, (dict, set, frozenset)):
+            kind = _OTHER
+        elif np.issubdtype(key_type, str):
+            kind = _STR
+        elif key_type is slice:
+            kind = _SLICE
+        elif np.issubdtype(key_type, np.ndarray):
+            kind = _SEQ
+        else:
+            kind = _OTHER
+        _KEY_KINDS[key_type] = kind
+    return kind
+
+
+def _is_basic_key(key) -> bool:
+    """Whether key is an int or slice, which numpy indexes without copying"""
+    return type(key) is slice or isinstance(key, (int, np.integer)) and \
+        type(key) is not bool
+
+
+def _to_dict(arr: np.ndarray, labels: list, nans: np.ndarray) -> dict:
+    """Nested dict of arr keyed by labels, leaving out the nan leaves."""
+    if len(labels) > 1:
+        return {k: _to_dict(a, labels[1:], n)
+                for k, a, n in zip(labels[0], arr, nans)}
+    return {k: v for k, v, n in zip(labels[0], arr, nans) if not n}
+
+
 def is_unique(arr: np.ndarray) -> bool:
     """Check if an array is unique.
 
@@ -904,7 +1060,13 @@ def is_unique(arr: np.ndarray) -> bool:
     True
     >>> is_unique(np.array([1, 2, 2]))
     False
+    >>> is_unique(np.array(['a', 'b', 'a']))
+    False
     """
+    arr = np.asarray(arr)
+    if arr.dtype.kind in 'US':
+        # hashing the strings is cheaper than sorting them
+        return len(set(arr.ravel().tolist())) == arr.size
     return np.unique(arr).shape[0] == np.prod(arr.shape)
 
 
@@ -947,15 +1109,14 @@ class Labels(np.char.chararray):
     def __matmul__(self, other):
         if not isinstance(other, Labels):
             raise NotImplementedError("Only Labels @ Labels is supported")
-        s_str, o_str = self.astype(str), other.astype(str)
-
-        # Convert the arrays to 2D
-        s_str_2d = s_str[..., None]
-        o_str_2d = o_str[None]
+        s_str = self.view(np.ndarray)
+        # add the delimiter to the smaller operand, so the broadcast grid is
+        # only written once
+        o_str = np.char.add(self.delimiter, other.view(np.ndarray))
 
         # Use broadcasting to create a result array with combined strings
-        result = s_str_2d + o_str_2d
-        return result
+        result = np.char.add(s_str[..., None], o_str[None])
+        return Labels(result)
 
     def __add__(self, other):
         result = self.view(np.char.chararray).__add__(
@@ -992,13 +1153,24 @@ class Labels(np.char.chararray):
         [['a-d-a-e-a-f-a-g-b-d-b-e', 'b-f-b-g-c-d-c-e-c-f-c-g'], ['a-d-b-f'...
         """
         new_labels = [[None for _ in range(s)] for s in self.shape]
+        # labels are always stored as str, so a plain view needs no cast
+        strings = self.view(np.char.chararray)
+        # split every label once, rather than once per axis
+        tokens = np.empty(self.shape, dtype=object)
+        delim = self.delimiter
+        tokens.flat = [set(t.split(delim)) for t in strings.ravel().tolist()]
         for i, dim in enumerate(self.shape):
             for j in range(dim):
-                row = np.take(self, j, axis=i).flatten().astype(str)
-                splitted = row.split(self.delimiter)
-                common = functools.reduce(np.intersect1d, splitted)
+                row = np.take(tokens, j, axis=i).ravel()
+                if row.size == 1:
+                    # nothing to intersect, so keep the label as is
+                    common = np.take(strings, j, axis=i).ravel()[0].split(
+                        self.delimiter)
+                else:
+                    common = sorted(set.intersection(*row))
                 if len(common) == 0:
-                    common = np.unique(row).tolist()
+                    common = np.unique(
+                        np.take(strings, j, axis=i)).tolist()
                 new_labels[i][j] = self.delimiter.join(common)
             new_labels[i] = _make_array_unique(np.array(new_labels[i]),
                                                self.delimiter)
@@ -1021,6 +1193,14 @@ class Labels(np.char.chararray):
         else:
             return tuple(map(int, idx))
 
+    def _label_positions(self) -> dict[str, list[int]]:
+        """Positions of each label, built for a single lookup of many keys.
+        Like chararray comparisons, trailing whitespace is ignored."""
+        positions = {}
+        for i, lab in enumerate(self.tolist()):
+            positions.setdefault(lab.rstrip(), []).append(i)
+        return positions
+
     def join(self, axis: int = None):
         """Join the labels into a single string using the delimiter
 
@@ -1187,37 +1367,25 @@ def inner_all_keys(data: dict, keys: list = None, lvl: int = 0):
     """
     if keys is None:
         keys = []
-    if isinstance(data, dict):
-        if len(keys) < lvl + 1:
-            keys.append(list(data.keys()))
-        else:
-            add_to_list_if_not_present(keys[lvl], data.keys())
-        for d in data.values():
-            if np.isscalar(d):
-                continue
-            inner_all_keys(d, keys, lvl + 1)
-    elif isinstance(data, np.ndarray):
-        data = np.atleast_1d(data)
-        rows = range(data.shape[0])
-        if len(keys) < lvl + 1:
-            keys.append(list(rows))
-        else:
-            add_to_list_if_not_present(keys[lvl], rows)
-        if len(data.shape) > 1:
-            if not np.isscalar(data[0]):
-                inner_all_keys(data[0], keys, lvl + 1)
-    else:
-        raise TypeError(f"Unexpected data type: {type(data)}")
+    _walk_dict(data, keys, lvl, leaves=False)
     return tuple(map(tuple, keys))
 
 
-def inner_array(data: dict | np.ndarray) -> np.ndarray | None:
+def inner_array(data: dict | np.ndarray, keys: tuple[tuple, ...] = None
+                ) -> np.ndarray | None:
     """Convert a nested dictionary to a nested array.
 
+    Each leaf is written to the position given by its keys, so missing
+    entries are left as nan.
+
     Parameters
     ----------
     data : dict or np.ndarray
         The nested dictionary to convert.
+    keys : tuple[tuple, ...], optional
+        The keys of each level of data, as returned by `inner_all_keys`. If
+        not given, they are computed from data. Keys of data missing from
+        them are appended to their level.
 
     Returns
     -------
@@ -1238,35 +1406,122 @@ def inner_array(data: dict | np.ndarray) -> np.ndarray | None:
     >>> inner_array(data)
     array([[[ 1.,  2.,  3.],
             [ 4.,  5., nan]]])
+    >>> data = {'a': {'b': {'e': 1}}, 'd': {'b': {'c': 2, 'e': 3}}}
+    >>> inner_array(data)
+    array([[[ 1., nan]],
+    <BLANKLINE>
+           [[ 3.,  2.]]])
+    >>> inner_array({'a': {'b': [1, 2]}})
+    array([[[1., 2.]]])
     """
-    if np.isscalar(data):
+    if isinstance(data, _SCALAR_TYPES):
         return data
-    elif isinstance(data, dict):
-        gen_arr = (inner_array(d) for d in data.values())
-        arr = [a for a in gen_arr if a is not None]
-        if len(arr) > 0:
-            return concatenate_arrays(arr, axis=None)
-
-    # Call np.atleast_1d once and store the result in a variable
-    data_1d = np.atleast_1d(data)
-
-    # Use the stored result to check the length of data
-    if len(data_1d) == 0:
-        return
-    elif len(data_1d) == 1:
-        return data
-    else:
-        return np.array(data)
+    keys = [] if keys is None else [list(k) for k in keys]
+    return _fill(keys, *_walk_dict(data, keys))
 
 
-def _combine_arrays(*arrays, delim: str = '-') -> np.ndarray:
-    # Create a meshgrid of indices
-    grids = np.meshgrid(*arrays, indexing='ij')
+def _flatten_dict(data: dict) -> tuple[np.ndarray, tuple[tuple, ...]]:
+    """Get both the `inner_all_keys` and `inner_array` of data in one walk."""
+    keys = []
+    out = _fill(keys, *_walk_dict(data, keys))
+    return out, tuple(map(tuple, keys))
 
-    # Combine the grids into a single array with string concatenation
-    result = np.core.defchararray.add(grids[0], delim)
-    for grid in grids[1:]:
-        result = np.core.defchararray.add(result, grid)
+
+def _walk_dict(data: dict, keys: list[list], lvl: int = 0,
+               leaves: bool = True) -> tuple[list, list, list]:
+    """Walk a nested dict once, collecting its keys and its leaves.
+
+    The keys of each level are appended to keys, in place, in the order they
+    are first seen. Array leaves, including sequences such as lists, add a
+    range of positions for each of their dimensions, with the first row of
+    each level standing in for the rest.
+
+    Returns the coordinates and values of the scalar leaves, and the
+    (coordinates, array) pairs of the array leaves. These are left empty
+    when leaves is False.
+    """
+    indices = [{k: i for i, k in enumerate(level)} for level in keys]
+
+    def _register(lvl: int, new: Iterable):
+        if len(keys) < lvl + 1:
+            keys.append(list(new))
+            indices.append({k: i for i, k in enumerate(keys[lvl])})
+        else:
+            index = indices[lvl]
+            for k in new:
+                if k not in index:
+                    index[k] = len(keys[lvl])
+                    keys[lvl].append(k)
+
+    coords, values, blocks = [], [], []
+    stack = [((), data)]
+    while stack:
+        path, d = stack.pop()
+        if not isinstance(d, (dict, np.ndarray)):
+            arr = np.asarray(d)
+            if arr.dtype == object:
+                raise TypeError(f"Unexpected data type: {type(d)}")
+            d = arr
+        if isinstance(d, np.ndarray):
+            if leaves:
+                blocks.append((path, d))
+            d = np.atleast_1d(d)
+            level = lvl + len(path)
+            while True:
+                _register(level, range(d.shape[0]))
+                if d.ndim == 1:
+                    break
+                d = d[0]
+                level += 1
+            continue
+
+        level = lvl + len(path)
+        _register(level, d.keys())
+        index = indices[level]
+        children = []
+        for k, v in d.items():
+            if isinstance(v, _SCALAR_TYPES):
+                if leaves:
+                    coords.append(path + (index[k],))
+                    values.append(v)
+            else:
+                children.append((path + (index[k],), v))
+        stack.extend(reversed(children))
+    return coords, values, blocks
+
+
+def _fill(keys: list[list], coords: list[tuple], values: list,
+          blocks: list[tuple]) -> np.ndarray:
+    """Write the leaves of `_walk_dict` to a nan array shaped by keys."""
+    out = np.full(tuple(map(len, keys)), np.nan)
+    if coords:
+        try:
+            pos = np.array(coords, dtype=np.intp)
+        except ValueError:  # leaves at different depths
+            pos = None
+        if pos is None or pos.ndim != 2 or pos.shape[1] != out.ndim:
+            # leaves above the deepest level fill the start of the rest
+            pos = np.zeros((len(coords), out.ndim), dtype=np.intp)
+            for i, c in enumerate(coords):
+                pos[i, :len(c)] = c
+        out[tuple(pos.T)] = values
+    for path, d in blocks:
+        # array leaves fill the start of their remaining dimensions
+        block = path + tuple(slice(n) for n in d.shape)
+        out[block + (0,) * (out.ndim - len(block))] = d
+    return out
+
+
+def _combine_arrays(*arrays, delim: str = '-') -> np.ndarray:
+    # Give each array its own axis so the concatenations broadcast into the
+    # full grid instead of materializing a meshgrid per input
+    n = len(arrays)
+    result = np.char.add(np.reshape(arrays[0], (-1,) + (1,) * (n - 1)),
+                         delim)
+    for i, arr in enumerate(arrays[1:], 1):
+        shape = [1] * n
+        shape[i] = -1
+        result = np.char.add(result, np.reshape(arr, shape))
 
     return result
 
@@ -1303,35 +1558,34 @@ def combine(data: dict, levels: tuple[int, int], delim: str = '-') -> dict:
     assert levels[0] >= 0, "first level must be >= 0"
     assert levels[1] > levels[0], "second level must be > first level"
 
-    def _combine_helper(data, levels, depth, keys):
-        if depth == levels[1]:
-            return {f'{keys[levels[0]]}{delim}{k}': v for k, v in data.items()}
-        elif depth == levels[0]:
-            new_dict = {}
-            for k, v in data.items():
-                for k2, v2 in _combine_helper(v, levels, depth + 1,
-                                              keys + [k]).items():
-                    if isinstance(v2, dict):
-                        if k2 in new_dict:
-                            new_dict[k2] = _merge(new_dict[k2], v2)
-                        else:
-                            new_dict[k2] = v2
-                    else:
-                        new_dict[k2] = v2
-            return new_dict
+    lo, hi = levels
+
+    def _new_path(path: tuple) -> tuple:
+        if len(path) > hi:
+            return (path[:lo] + path[lo + 1:hi] +
+                    (f'{path[lo]}{delim}{path[hi]}',) + path[hi + 1:])
+        return path[:lo] + path[lo + 1:]
+
+    # walk the leaves in order, moving each one to its combined path
+    result = {}
+    stack = [((), data)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict) and value:
+            stack.extend((path + (k,), v) for k, v in reversed(value.items()))
+            continue
+        elif not isinstance(value, dict) and len(path) <= hi:
+            raise ValueError(f"Leaf at {path} is above level {hi}")
+        new_path = _new_path(path)
+        if not new_path:
+            continue
+        node = result
+        for k in new_path[:-1]:
+            node = node.setdefault(k, {})
+        if isinstance(value, dict):
+            node.setdefault(new_path[-1], {})
         else:
-            return {k: _combine_helper(v, levels, depth + 1, keys + [k]) for
-                    k, v in data.items()}
-
-    def _merge(d1: dict, d2: dict) -> dict:
-        for k, v in d2.items():
-            if isinstance(v, dict):
-                d1[k] = _merge(d1.get(k, {}), v)
-            else:
-                d1[k] = v
-        return d1
-
-    result = _combine_helper(data, levels, 0, [])
+            node[new_path[-1]] = value
 
     return result
 
@@ -1400,26 +1654,21 @@ def get_elbow(data: np.ndarray) -> int:
     >>> get_elbow(data)
     4
     """
-    nPoints = len(data)
-    allCoord = np.vstack((range(nPoints), data)).T
-    firstPoint = allCoord[0]
-    lineVec = allCoord[-1] - allCoord[0]
-    lineVecNorm = lineVec / np.sqrt(np.sum(lineVec ** 2))
-    vecFromFirst = allCoord - firstPoint
-    scalarProduct = np.sum(vecFromFirst * np.tile(lineVecNorm,
-                                                  (nPoints, 1)), axis=1)
-    vecFromFirstParallel = np.outer(scalarProduct, lineVecNorm)
-    vecToLine = vecFromFirst - vecFromFirstParallel
-    distToLine = np.sqrt(np.sum(vecToLine ** 2, axis=1))
-    # set distance to points below lineVec to 0
-    distToLine[vecToLine[:, 1] < 0] = 0
-    idxOfBestPoint = np.argmax(distToLine)
-    return idxOfBestPoint
+    data = np.asarray(data, dtype=float)
+    n_points = len(data)
+    # perpendicular distance of each point above the line from the first to
+    # the last point, times the length of that line (which is the same for
+    # every point, so it does not change the argmax)
+    dist = (n_points - 1) * (data - data[0])
+    dist -= (data[-1] - data[0]) * np.arange(n_points)
+    # points below the line are not candidates
+    np.maximum(dist, 0, out=dist)
+    return int(np.argmax(dist))
 
 
 def events_in_order(inst: mne.BaseEpochs) -> list[str]:
     ids = {v: k for k, v in inst.event_id.items()}
-    return [ids[e[2]] for e in inst.events]
+    return [ids[code] for code in inst.events[:, 2].tolist()]
 
 
 if __name__ == "__main__":
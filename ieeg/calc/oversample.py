@@ -184,13 +184,15 @@ class MinimumNaNSplit(RepeatedStratifiedKFold):
         cats = np.unique(labels)
         gt_labels = [0] * cats.shape[0]
         min_trials *= self.n_splits
+        # which trials are free of nans does not depend on the shuffle, so
+        # each attempt only has to count them per label
+        valid = np.all(~np.isnan(arr), axis=2)
         i = 0
         while not all(g >= min_trials for g in gt_labels):
             np.random.shuffle(labels)
             for j, l in enumerate(cats):
-                eval_arr = np.take(arr, np.flatnonzero(labels == l), trials_ax)
-                gt_labels[j] = np.min(np.sum(
-                    np.all(~np.isnan(eval_arr), axis=2), axis=trials_ax))
+                gt_labels[j] = np.min(np.sum(np.compress(
+                    labels == l, valid, trials_ax), axis=trials_ax))
             if sum(gt_labels) < min_trials * cats.shape[0]:
                 raise ValueError("Not enough non-nan trials to shuffle")
             i += 1
@@ -374,13 +376,17 @@ def mixup2(arr: np.ndarray, labels: np.ndarray, obs_axis: int,
         n_nan = np.where(is_nan)[0]
         n_non_nan = np.where(~is_nan)[0]
 
+        # the non-nan rows of each class are shared by all of its nan rows
+        class_choices = {l_class: np.flatnonzero(
+            np.logical_and(~is_nan, labels == l_class))
+            for l_class in np.unique(labels[n_nan])}
+
         for i in n_nan:
-            l_class = labels[i]
-            possible_choices = np.nonzero(np.logical_and(
-                ~is_nan, labels == l_class))[0]
-            choice1 = np.random.choice(possible_choices)
+            choice1 = np.random.choice(class_choices[labels[i]])
             choice2 = np.random.choice(n_non_nan)
             lam = np.random.beta(alpha, alpha)
             if lam < .5:
                 lam = 1 - lam
-            arr[i] = lam * arr[choice1] + (1 - lam) * arr[choice2]
+            row = arr[i]
+            np.multiply(arr[choice1], lam, out=row)
+            row += (1 - lam) * arr[choice2]
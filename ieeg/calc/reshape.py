@@ -45,8 +45,9 @@ def stitch_mats(mats: list[np.ndarray], overlaps: list[int], axis: int = 0
     for i, over in enumerate(overlaps):
         stitches = stitches[:-2] + merge(stitches[-1], mats[i + 1], over, axis)
     out = np.concatenate(stitches, axis=axis)
-    if np.array_equal(out.astype(int), out):
-        return out.astype(int)
+    as_int = out.astype(int)
+    if np.array_equal(as_int, out):
+        return as_int
     else:
         return out
 
@@ -598,8 +598,16 @@ def _perm_gt_1d(diff, axis=0):
     m = diff.shape[axis] - 1
     sorted_indices = diff.argsort(axis=axis)  # Get sorted indices
     proportions = np.arange(diff.shape[axis]) / m  # Create proportions array
-    # Rearrange to match original order
-    return proportions[sorted_indices.argsort(axis=axis)]
+    # Rearrange to match original order by scattering through the sort
+    # permutation instead of sorting a second time to invert it
+    out = np.empty(diff.shape)
+    if diff.ndim == 1:  # a plain scatter skips put_along_axis' index setup
+        out[sorted_indices] = proportions
+        return out
+    shape = [1] * diff.ndim
+    shape[axis] = -1
+    np.put_along_axis(out, sorted_indices, proportions.reshape(shape), axis)
+    return out
 
 
 def time_cluster(act: np.ndarray, perm: np.ndarray, p_val: float = None,
@@ -850,6 +858,16 @@ def sum_squared(x: np.ndarray) -> np.ndarray | float:
     return np.dot(x_flat, x_flat)
 
 
+def _sum_abs_squared(x: np.ndarray, axis: int) -> np.ndarray:
+    """Sum of ``np.abs(x) ** 2`` without the square root or extra copies."""
+    if np.iscomplexobj(x):
+        out = np.square(x.real)
+        out += np.square(x.imag)
+    else:
+        out = np.square(x)
+    return np.sum(out, axis)
+
+
 def sine_f_test(window_fun: np.ndarray, x_p: np.ndarray
                 ) -> (np.ndarray, np.ndarray):
     """Computes the F-statistic for sine wave in locally-white noise.
@@ -902,10 +920,10 @@ def sine_f_test(window_fun: np.ndarray, x_p: np.ndarray
            [1., 1.]]))
 
     """
-    # drop the even tapers
+    # drop the even tapers (slices are views, unlike index arrays)
     n_tapers = len(window_fun)
-    tapers_odd = np.arange(0, n_tapers, 2)
-    tapers_even = np.arange(1, n_tapers, 2)
+    tapers_odd = slice(0, n_tapers, 2)
+    tapers_even = slice(1, n_tapers, 2)
     tapers_use = window_fun[tapers_odd]
 
     # sum tapers for (used) odd prolates across time (n_tapers, 1)
@@ -915,8 +933,7 @@ def sine_f_test(window_fun: np.ndarray, x_p: np.ndarray
     H0_sq = sum_squared(H0)
 
     # sum of the product of x_p and H0 across tapers (1, n_freqs)
-    exp_H0 = np.reshape(H0, (1, -1, 1))
-    x_p_H0 = np.sum(x_p[:, tapers_odd, :] * exp_H0, axis=1)
+    x_p_H0 = np.matmul(H0, x_p[:, tapers_odd, :])
 
     # resulting calculated amplitudes for all freqs
     A = x_p_H0 / H0_sq
@@ -929,8 +946,8 @@ def sine_f_test(window_fun: np.ndarray, x_p: np.ndarray
     # numerator for F-statistic
     num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
     # denominator for F-statistic
-    den = (np.sum(np.abs(x_p[:, tapers_odd, :] - x_hat) ** 2, 1) +
-           np.sum(np.abs(x_p[:, tapers_even, :]) ** 2, 1))
+    den = (_sum_abs_squared(x_p[:, tapers_odd, :] - x_hat, 1) +
+           _sum_abs_squared(x_p[:, tapers_even, :], 1))
     den = np.where(den == 0, np.inf, den)
     f_stat = num / den
 
@@ -1,6 +1,6 @@
 import re
 from functools import singledispatch
-from os import scandir, mkdir, path as op, walk
+from os import scandir, mkdir, path as op
 
 import mne
 import numpy as np
@@ -30,14 +30,27 @@ def find_dat(folder: PathLike) -> (PathLike, PathLike):
     """
     cleanieeg = None
     ieeg = None
-    for root, _, files in walk(folder):
-        for file in files:
-            if re.match(r".*cleanieeg\.dat.*", file):
-                cleanieeg: PathLike = op.join(root, file)
-            elif re.match(r".*ieeg\.dat.*", file):
-                ieeg: PathLike = op.join(root, file)
+    # depth first, top down search (same order as os.walk) that stops as
+    # soon as both files are found
+    stack = [folder]
+    while stack:
+        root = stack.pop()
+        try:
+            entries = list(scandir(root))
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif "cleanieeg.dat" in entry.name:
+                cleanieeg: PathLike = op.join(root, entry.name)
+            elif "ieeg.dat" in entry.name:
+                ieeg: PathLike = op.join(root, entry.name)
             if ieeg is not None and cleanieeg is not None:
                 return ieeg, cleanieeg
+        stack.extend(reversed(subdirs))
     raise FileNotFoundError("Not all .dat files were found:")
 
 
@@ -111,7 +124,7 @@ def raw_from_layout(layout: BIDSLayout, preload: bool = True,
         for r in runs:
             BIDS_path = bidspath_from_layout(layout, run=r, **kwargs)
             new_raw = read_raw_bids(bids_path=BIDS_path, verbose=verbose)
-            raw.append(new_raw.copy())
+            raw.append(new_raw)
         whole_raw: mne.io.Raw = mne.concatenate_raws(raw)
     else:
         BIDS_path = bidspath_from_layout(layout, **kwargs)
@@ -142,11 +155,17 @@ def open_dat_file(file_path: str, channels: list[str], sfreq: int = 2048,
     -------
     mne.io.RawArray
     """
-    with open(file_path, mode='rb') as f:
-        data = np.fromfile(f, dtype="float32")
     if "Trigger" in channels:
         channels.remove("Trigger")
-    array = np.reshape(data, [len(channels), -1], order='F')
+    # samples are interleaved by channel, so the file maps directly onto a
+    # fortran ordered array without reading it into memory first
+    n_samples, remainder = divmod(op.getsize(file_path), 4 * len(channels))
+    if remainder:
+        raise ValueError(f"Size of {file_path} is not a whole number of "
+                         f"float32 samples for {len(channels)} channels; "
+                         f"the channel list or the file is wrong")
+    array = np.memmap(file_path, dtype="float32", mode='r',
+                      shape=(len(channels), n_samples), order='F')
     match units:
         case "V":
             factor = 1
@@ -194,7 +213,8 @@ def get_data(task: str, root: PathLike,
     scan = scandir(root)
 
     # keep only matching BIDS directories
-    matches = filter(lambda x: re.match(prefix + task, x.name), scan)
+    pattern = re.compile(prefix + task)
+    matches = filter(lambda x: pattern.match(x.name), scan)
 
     # check that there is at least one match
     ordered = sorted(matches, key=lambda x: x.name)
@@ -318,11 +338,12 @@ def _(inst: mne.io.base.BaseRaw,
       layout: BIDSLayout, description: list[str] | str = None, verbose=None):
     if not hasattr(inst, 'filenames'):
         inst.filenames = inst.info['subject_info'].get('files', None)
+    bads = set(inst.info['bads'])
+    goods = [ch for ch in inst.ch_names if ch not in bads]
     for i, file in enumerate(inst.filenames):
         fname = op.join(layout.root, file)
         update(fname, inst.info['bads'], description=description, status='bad',
                verbose=verbose)
-        goods = [ch for ch in inst.ch_names if ch not in inst.info['bads']]
         update(fname, channels=goods, status='good', verbose=None)
 
 
@@ -331,11 +352,12 @@ def _(inst: mne.time_frequency.BaseTFR,
       layout: BIDSLayout, description: list[str] | str = None, verbose=None):
     if not hasattr(inst, 'filenames'):
         inst.filenames = inst.info['subject_info'].get('files', None)
+    bads = set(inst.info['bads'])
+    goods = [ch for ch in inst.ch_names if ch not in bads]
     for i, file in enumerate(inst.filenames):
         fname = op.join(layout.root, file)
         update(fname, inst.info['bads'], description=description, status='bad',
                verbose=verbose)
-        goods = [ch for ch in inst.ch_names if ch not in inst.info['bads']]
         update(fname, channels=goods, status='good', verbose=None)
 
 
@@ -181,9 +181,8 @@ def _prep_for_filtering(x: np.ndarray, picks: list = None
     x.shape = (np.prod(x.shape[:-1]), x.shape[-1])
     if len(orig_shape) == 3:
         n_epochs, n_channels, n_times = orig_shape
-        offset = np.repeat(np.arange(0, n_channels * n_epochs, n_channels),
-                           len(picks))
-        picks = np.tile(picks, n_epochs) + offset
+        offset = np.arange(0, n_channels * n_epochs, n_channels)
+        picks = (offset[:, None] + picks).ravel()
     elif len(orig_shape) > 3:
         raise ValueError('picks argument is not supported for data with more'
                          ' than three dimensions')
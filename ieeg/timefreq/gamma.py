@@ -1,13 +1,14 @@
-from functools import singledispatch
+import math
+from functools import cache, singledispatch
 
 import numpy as np
 from mne import Epochs
 from mne.time_frequency import EpochsTFR
 from mne.io import Raw, base
-from tqdm import tqdm
 from joblib import Parallel, delayed
+from tqdm import tqdm
 
-from ieeg.process import COLA, cpu_count, get_mem, parallelize
+from ieeg.process import COLA, cpu_count, get_mem
 from ieeg.timefreq.utils import BaseEpochs, Evoked, Signal, calculate_wavelets
 from ieeg.timefreq.hilbert import (filterbank_hilbert_first_half_wrapper,
                                    extract_channel_wrapper)
@@ -82,6 +83,9 @@ def extract(data: np.ndarray, fs: float = None,
         Whether to copy data or operate in place if False, by default True
     n_jobs : int, optional
         Number of jobs to run in parallel, by default all available cores
+    verbose : bool, optional
+        Whether to show a progress bar over the channels of 3-D (epoched)
+        data, by default True. 2-D data is always processed silently.
 
     Returns
     -------
@@ -139,33 +143,62 @@ def extract(data: np.ndarray, fs: float = None,
         in_data = data
 
     passband = list(passband)
-    env = np.zeros(in_data.shape)
-
-    if len(in_data.shape) == 3:  # Assume shape is (trials, channels, time)
-        trials = range(in_data.shape[0])
-        if n_jobs != 1:
-            ins = (in_data[trial].T for trial in trials)
-            par_out = parallelize(filterbank_hilbert, ins, fs=fs, Wn=passband,
-                                  n_jobs=n_jobs)
-            env[:, :, :] = np.array([np.sum(out, axis=-1).T for
-                                     out in par_out])
-        else:
-            if verbose:
-                trials = tqdm(trials)
-            for trial in trials:
-                out = filterbank_hilbert(in_data[trial, :, :].T, fs,
-                                         passband, 1)
-                env[trial, :, :] = np.sum(out, axis=-1).T
-    elif len(in_data.shape) == 2:  # Assume shape is (channels, time)
-        out = filterbank_hilbert(in_data.T, fs, passband, n_jobs)
-        env = np.sum(out, axis=-1).T
+
+    if in_data.ndim == 3:  # Assume shape is (trials, channels, time)
+        return _extract_3d(in_data, fs, passband, n_jobs, verbose)
+    elif in_data.ndim == 2:  # Assume shape is (channels, time)
+        return _extract_2d(in_data, fs, passband, n_jobs)
     else:
         raise ValueError("number of dims should be either 2 or 3, not {}"
-                         "".format(len(in_data.shape)))
+                         "".format(in_data.ndim))
+
+
+def _extract_2d(in_data: np.ndarray, fs: float, passband: list[int],
+                n_jobs: int) -> np.ndarray:
+    env = np.empty(in_data.shape, dtype='float32')
+    _sum_bands(in_data.T, fs, passband, n_jobs, env)
+    return env
 
+
+# upper bound on the bytes of trials stacked into one filter bank pass
+_CHUNK_BYTES = 1 << 28
+
+
+def _extract_3d(in_data: np.ndarray, fs: float, passband: list[int],
+                n_jobs: int, verbose: bool) -> np.ndarray:
+    # stack chunks of trials along the channel axis so the filter bank is
+    # built and the FFTs are planned once per chunk. At its peak a chunk
+    # holds 20 bytes per sample: the float32 stack (4 bytes), its complex64
+    # FFT (8 bytes) and the complex64 copy the filter bank makes of it
+    n_trials, n_chans, n_times = in_data.shape
+    step = max(1, _CHUNK_BYTES // (20 * n_chans * n_times))
+    env = np.empty(in_data.shape, dtype='float32')
+    with tqdm(total=n_trials * n_chans, unit='channel',
+              disable=not verbose) as pbar:
+        for start in range(0, n_trials, step):
+            chunk = in_data[start:start + step]
+            n_chunk = chunk.shape[0]
+            # transpose straight into float32, so no float64 copy is made
+            x = np.empty((n_times, n_chunk * n_chans), dtype='float32')
+            x.reshape(n_times, n_chunk, n_chans)[...] = chunk.transpose(
+                2, 0, 1)
+            _sum_bands(x, fs, passband, n_jobs,
+                       env[start:start + n_chunk].reshape(-1, n_times), pbar)
     return env
 
 
+def _sum_bands(x: np.ndarray, fs: float, passband: list[int], n_jobs: int,
+               out: np.ndarray, pbar: tqdm = None):
+    # sum each channel's filter bank envelope as soon as it is computed, so
+    # the full (time, channels, bands) array from filterbank_hilbert is never
+    # built. out has shape (channels, time)
+    _, channels = _filterbank_channels(x, fs, passband, n_jobs)
+    for chn, amp in enumerate(channels):
+        np.sum(amp, axis=-1, out=out[chn])
+        if pbar is not None:
+            pbar.update()
+
+
 def _extract_inst(inst: Signal, fs: int, copy: bool, **kwargs) -> Signal:
     if fs is None:
         fs = inst.info['sfreq']
@@ -248,41 +281,47 @@ def get_centers(Wn):
         Center frequencies for filter bank.
         """
 
-    # create filter bank
-    a = np.array([np.log10(0.39), 0.5])
-    f0 = 0.018
-    octSpace = 1. / 7
     minf, maxf = Wn
     if minf >= maxf:
         raise ValueError(
             f'Upper bound of frequency range must be greater than lower '
             f'bound, but got lower bound of {minf} and upper bound of {maxf}')
-    maxfo = np.log2(maxf / f0)  # octave of max freq
+
+    # the filter bank only depends on the passband, so it is cached across
+    # trials and chunks
+    return _get_centers(float(minf), float(maxf)).copy()
+
+
+@cache
+def _get_centers(minf: float, maxf: float) -> np.ndarray:
+    # create filter bank
+    a = (math.log10(0.39), 0.5)
+    f0 = 0.018
+    octSpace = 1. / 7
+    maxfo = math.log2(maxf / f0)  # octave of max freq
 
     cfs = [f0]
-    sigma_f = 10 ** (a[0] + a[1] * np.log10(cfs[-1]))
+    sigma_f = 10 ** (a[0] + a[1] * math.log10(cfs[-1]))
 
-    while np.log2(cfs[-1] / f0) < maxfo:
+    while math.log2(cfs[-1] / f0) < maxfo:
 
         if cfs[-1] < 4:
             cfs.append(cfs[-1] + sigma_f)
         else:  # switches to log spacing at 4 Hz
-            cfo = np.log2(cfs[-1] / f0)  # current freq octave
+            cfo = math.log2(cfs[-1] / f0)  # current freq octave
             cfo += octSpace  # new freq octave
             cfs.append(f0 * (2 ** (cfo)))
 
-        sigma_f = 10 ** (a[0] + a[1] * np.log10(cfs[-1]))
+        sigma_f = 10 ** (a[0] + a[1] * math.log10(cfs[-1]))
 
     cfs = np.array(cfs)
-    if np.logical_and(cfs >= minf, cfs <= maxf).sum() == 0:
+    in_band = np.logical_and(cfs >= minf, cfs <= maxf)
+    if in_band.sum() == 0:
         raise ValueError(
             f'Frequency band is too narrow, so no filters in filterbank are '
             f'placed inside. Try a wider frequency band.')
 
-    cfs = cfs[np.logical_and(cfs >= minf,
-                             cfs <= maxf)]  # choose those that lie in the
-    # input freqRange
-    return cfs
+    return cfs[in_band]  # choose those that lie in the input freqRange
 
 
 def filterbank_hilbert(x, fs, Wn=[70, 150], n_jobs=1):
@@ -332,7 +371,18 @@ def filterbank_hilbert(x, fs, Wn=[70, 150], n_jobs=1):
 
     """
 
-    x = x.astype('float32')
+    n_bands, channels = _filterbank_channels(x, fs, Wn, n_jobs)
+    hilb_amp = np.empty((*x.shape, n_bands), dtype='float32')
+    for chn, amp in enumerate(channels):
+        hilb_amp[:, chn] = amp
+
+    return hilb_amp
+
+
+def _filterbank_channels(x, fs, Wn, n_jobs):
+    """Number of filter bank bands and a lazy iterator over the envelope of
+    each channel of x, shape (time, frequency_bins), in channel order."""
+    x = x.astype('float32', copy=False)
     minf, maxf = Wn
 
     if minf >= maxf:
@@ -346,18 +396,14 @@ def filterbank_hilbert(x, fs, Wn=[70, 150], n_jobs=1):
     def extract_channel(Xf):
         return extract_channel_wrapper(Xf, freqs, cfs, N, sds, h, minf, maxf)
 
-    # pre-allocate
-    hilb_amp = np.zeros((*x.shape, len(cfs)), dtype='float32')
+    n_bands = np.count_nonzero((cfs >= minf) & (cfs <= maxf))
 
     # process channels sequentially
     if n_jobs == 1:
-        for chn in range(x.shape[1]):
-            hilb_amp[:, chn] = extract_channel(Xf[:, chn])
+        channels = (extract_channel(Xf[:, chn]) for chn in range(x.shape[1]))
     # process channels in parallel
     else:
-        results = Parallel(n_jobs)(delayed(extract_channel)(
-            Xf[:, chn]) for chn in range(x.shape[1]))
-        for chn, amp in enumerate(results):
-            hilb_amp[:, chn] = amp
+        channels = Parallel(n_jobs, return_as="generator")(delayed(
+            extract_channel)(Xf[:, chn]) for chn in range(x.shape[1]))
 
-    return hilb_amp
+    return n_bands, channels
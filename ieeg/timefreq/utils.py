@@ -1,3 +1,4 @@
+from string import ascii_lowercase
 from typing import Union
 
 import numpy as np
@@ -11,6 +12,8 @@ from ieeg import Signal
 from ieeg.process import ensure_int, parallelize, validate_type
 from joblib import delayed, Parallel
 
+_TIME_UNITS = {'us': 1e-6, 'ms': 1e-3, 's': 1, 'sec': 1, 'm': 60, 'min': 60}
+
 
 def to_samples(time_length: Union[str, int], sfreq: float) -> int:
     """Convert a time length to a number of samples.
@@ -34,30 +37,13 @@ def to_samples(time_length: Union[str, int], sfreq: float) -> int:
         err_msg = ('filter_length, if a string, must be a '
                    'human-readable time, e.g. "0.7s", or "700ms", not '
                    '"%s"' % time_length)
-        low = time_length.lower()
-        if low.endswith('us'):
-            mult_fact = 1e-6
-            time_length = time_length[:-2]
-        elif low.endswith('ms'):
-            mult_fact = 1e-3
-            time_length = time_length[:-2]
-        elif low[-1] == 's':
-            mult_fact = 1
-            time_length = time_length[:-1]
-        elif low.endswith('sec'):
-            mult_fact = 1
-            time_length = time_length[:-3]
-        elif low[-1] == 'm':
-            mult_fact = 60
-            time_length = time_length[:-1]
-        elif low.endswith('min'):
-            mult_fact = 60
-            time_length = time_length[:-3]
-        else:
+        number = time_length.rstrip(ascii_lowercase)
+        mult_fact = _TIME_UNITS.get(time_length[len(number):])
+        if mult_fact is None:
             raise ValueError(err_msg)
         # now get the number
         try:
-            time_length = float(time_length)
+            time_length = float(number)
         except ValueError:
             raise ValueError(err_msg)
         time_length = max(int(np.ceil(time_length * mult_fact * sfreq)), 1)
@@ -96,8 +82,10 @@ def crop_pad(inst: Signal, pad: str, copy: bool = False) -> Signal:
 
 @verbose
 def wavelet_scaleogram(inst: BaseEpochs, f_low: float = 2,
-                       f_high: float = 1000, k0: int = 6, n_jobs: int = 1,
-                       decim: int = 1, verbose=10) -> EpochsTFR:
+                       f_high: float = 1000, k0: int = 6,
+                       n_jobs: int | str = 1, decim: int = 1,
+                       dtype: np.dtype = np.float64,
+                       verbose=10) -> EpochsTFR:
     """Compute the wavelet scaleogram.
 
 
@@ -112,10 +100,14 @@ def wavelet_scaleogram(inst: BaseEpochs, f_low: float = 2,
         The highest frequency to compute the scaleogram for.
     k0 : int
         The wavelet parameter.
-    n_jobs : int
-        The number of jobs to run in parallel.
+    n_jobs : int | str
+        The number of jobs to run in parallel. If 'cuda', the transforms are
+        run on the GPU instead, which requires cupy.
     decim : int
         The decimation factor.
+    dtype : np.dtype
+        The real floating point type to compute the scaleogram in. Use
+        np.float32 to halve the memory and time at reduced precision.
     verbose : int
         The verbosity level.
 
@@ -151,19 +143,31 @@ def wavelet_scaleogram(inst: BaseEpochs, f_low: float = 2,
     """
     data = inst.get_data(copy=False)
 
-    f = np.fft.fft(data - np.mean(data, axis=-1, keepdims=True))
+    n = data.shape[-1]
+    f = np.fft.rfft((data - np.mean(data, axis=-1, keepdims=True)
+                     ).astype(dtype, copy=False))
 
     daughter, period = calculate_wavelets(inst.info['sfreq'], f_high, f_low,
-                                          data.shape[-1], k0)
+                                          n, k0)
+    # the wavelets are zero at k <= 0, so only the non-negative half of the
+    # spectrum is needed; the negative frequencies are left as zeros
+    daughter = daughter[:, :f.shape[-1]].astype(dtype)
 
     wave = np.empty((f.shape[0], f.shape[1], len(period),
-                     data[..., ::decim].shape[-1]), dtype=np.float64)
+                     data[..., ::decim].shape[-1]), dtype=dtype)
+    if n_jobs == 'cuda':
+        _ifft_abs_cuda(f, daughter, n, decim, wave)
+        return EpochsTFR(inst.info, wave, inst.times[::decim], 1 / period)
+
     # ch X trials X freq X time
     ins = ((f[:, None, i], i) for i in range(f.shape[1]))
 
     def _ifft_abs(x, i):
-        np.abs(np.fft.ifft(x * np.tile(daughter, (
-            f.shape[0], 1, 1)))[..., ::decim], out=wave[:, i])
+        # x broadcasts against daughter, so the kernel is never copied per
+        # trial, and only the non-negative half of spec is filled
+        spec = np.zeros(x.shape[:1] + daughter.shape[:1] + (n,), f.dtype)
+        np.multiply(x, daughter, out=spec[..., :daughter.shape[-1]])
+        np.abs(np.fft.ifft(spec)[..., ::decim], out=wave[:, i])
 
     proc = Parallel(n_jobs=n_jobs, verbose=verbose, require="sharedmem",
                     return_as="generator_unordered")(delayed(_ifft_abs)(x, i)
@@ -176,6 +180,30 @@ def wavelet_scaleogram(inst: BaseEpochs, f_low: float = 2,
     return EpochsTFR(inst.info, wave, inst.times[::decim], 1 / period)
 
 
+def _ifft_abs_cuda(f: np.ndarray, daughter: np.ndarray, n: int, decim: int,
+                   out: np.ndarray):
+    """Fill out with abs(ifft(f * daughter)) computed on the GPU.
+
+    Channels are transformed one at a time, so only a single (trials, freq,
+    time) block has to fit in GPU memory, with every trial and frequency of
+    that block batched into one cuFFT call.
+    """
+    try:
+        import cupy as cp
+    except ImportError as err:
+        raise ImportError(
+            "n_jobs='cuda' requires cupy, which is not installed. Install "
+            "the build matching your CUDA toolkit, e.g. `pip install "
+            "cupy-cuda12x`, see https://docs.cupy.dev/en/stable/install.html"
+        ) from err
+
+    daughter = cp.asarray(daughter)
+    for i in range(f.shape[1]):
+        spec = cp.zeros((f.shape[0], daughter.shape[0], n), f.dtype)
+        spec[..., :daughter.shape[-1]] = cp.asarray(f[:, None, i]) * daughter
+        out[:, i] = cp.asnumpy(cp.abs(cp.fft.ifft(spec)[..., ::decim]))
+
+
 def calculate_wavelets(sfreq: float, f_high: float, f_low: float,
                        n_samples: int, k0: int = 6):
     """Calculate Morlet wavelets for a range of frequencies.
@@ -230,10 +258,17 @@ def calculate_wavelets(sfreq: float, f_high: float, f_low: float,
     scale1 = scale
     period = fourier_factor * scale1
 
-    expnt = -np.square(scale1[:, None] * k[None, :] - k0) / 2. * (k > 0.)
+    # build the daughter wavelets in a single (scale, k) buffer
+    positive = k > 0.
+    daughter = np.multiply.outer(scale1, k)
+    daughter -= k0
+    np.square(daughter, out=daughter)
+    daughter /= -2.
+    daughter *= positive
+    np.exp(daughter, out=daughter)
     norm = np.sqrt(scale1 * k[2]) * (np.power(np.pi, (-0.25))) * np.sqrt(n)
-    daughter = norm[:, None] * np.exp(expnt)
-    daughter = daughter * (k > 0.)
+    daughter *= norm[:, None]
+    daughter *= positive
 
     return daughter, period
 
@@ -359,13 +359,19 @@ def plot_on_average(sigs: Signal | str | mne.Info | list[Signal | str, ...],
     elif isinstance(picks[0], str):
         if len(sigs) == 1 and not picks[0].startswith(list(sigs.keys())[0]):
             picks = [subj + '-' + p for p in picks]
-        picks_in = [p in all_channel_name for p in picks]
+        all_channels = set(all_channel_name)
+        picks_in = [p in all_channels for p in picks]
         assert all(picks_in), (f"Channel not found: "
                                f"{picks[picks_in.index(False)]}")
     else:
         raise TypeError(f"picks must be list of str or int, not "
                         f"{type(picks[0])}")
 
+    # first position of each pick, for looking up per channel colors
+    pick_pos = {}
+    for i, p in enumerate(picks):
+        pick_pos.setdefault(p, i)
+
     default_c = parula.mat_colors.copy()
     for subj, new in sigs.items():
 
@@ -393,7 +399,8 @@ def plot_on_average(sigs: Signal | str | mne.Info | list[Signal | str, ...],
         # select colors
         if color is None and len(sigs) > 1:
             this_color = []
-            p_int = [new.ch_names.index(p) for p in these_picks]
+            ch_pos = {ch: i for i, ch in enumerate(new.ch_names)}
+            p_int = [ch_pos[p] for p in these_picks]
             groups = _group_channels(mne.pick_info(new, p_int))
             n_groups = len(set(groups.values()))
             while len(this_color) < n_groups:
@@ -401,7 +408,7 @@ def plot_on_average(sigs: Signal | str | mne.Info | list[Signal | str, ...],
         elif np.isscalar(color) or color is None:
             this_color = color
         elif len(color) == len(picks):
-            this_color = [color[picks.index(subj + '-' + p)]
+            this_color = [color[pick_pos[subj + '-' + p]]
                           for p in these_picks]
         else:
             this_color = color
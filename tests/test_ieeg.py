@@ -33,6 +33,23 @@ def test_raw_from_layout():
     assert isinstance(raw, BaseRaw)
 
 
+def test_open_dat_file(tmp_path):
+    from ieeg.io import open_dat_file
+    data = np.arange(12, dtype='float32').reshape(4, 3)  # samples x channels
+    fname = tmp_path / "ieeg.dat"
+    data.tofile(fname)
+    raw = open_dat_file(str(fname), ['a', 'b', 'c'], sfreq=100, units="V")
+    np.testing.assert_array_equal(raw.get_data(), data.T)
+
+
+def test_open_dat_file_bad_size(tmp_path):
+    from ieeg.io import open_dat_file
+    fname = tmp_path / "ieeg.dat"
+    np.arange(10, dtype='float32').tofile(fname)
+    with pytest.raises(ValueError, match="3 channels"):
+        open_dat_file(str(fname), ['a', 'b', 'c'], sfreq=100)
+
+
 @pytest.mark.parametrize("n_jobs", [1, 8])
 def test_line_filter(n_jobs):
     from ieeg.mt_filter import line_filter
@@ -84,6 +101,46 @@ def test_spect_2():
     assert np.allclose(out, spec_check)
 
 
+def test_extract_trial_chunks(monkeypatch):
+    from ieeg.timefreq import gamma
+    data = np.random.default_rng(0).standard_normal((5, 2, 400))
+    whole = gamma.extract(data, 400., n_jobs=1, verbose=False)
+    # force one trial per filter bank pass
+    monkeypatch.setattr(gamma, "_CHUNK_BYTES", 1)
+    chunked = gamma.extract(data, 400., n_jobs=1, verbose=False)
+    np.testing.assert_array_equal(whole, chunked)
+    single = gamma.extract(data[3], 400., n_jobs=1, verbose=False)
+    np.testing.assert_array_equal(chunked[3], single)
+
+
+def _scaleogram_inputs():
+    rng = np.random.default_rng(0)
+    n, decim = 64, 3
+    f = np.fft.rfft(rng.standard_normal((2, 3, n)))
+    daughter = rng.standard_normal((4, f.shape[-1])) + 0j
+    out = np.empty((2, 3, 4, len(range(0, n, decim))))
+    return f, daughter, n, decim, out
+
+
+def test_ifft_abs_cuda():
+    pytest.importorskip('cupy')
+    from ieeg.timefreq.utils import _ifft_abs_cuda
+    f, daughter, n, decim, out = _scaleogram_inputs()
+    _ifft_abs_cuda(f, daughter, n, decim, out)
+    spec = np.zeros(f.shape[:2] + (daughter.shape[0], n), f.dtype)
+    spec[..., :daughter.shape[-1]] = f[:, :, None] * daughter
+    expected = np.abs(np.fft.ifft(spec)[..., ::decim])
+    np.testing.assert_allclose(out, expected, rtol=1e-6, atol=1e-10)
+
+
+def test_ifft_abs_cuda_missing_cupy(monkeypatch):
+    import sys
+    from ieeg.timefreq.utils import _ifft_abs_cuda
+    monkeypatch.setitem(sys.modules, 'cupy', None)
+    with pytest.raises(ImportError, match="pip install cupy"):
+        _ifft_abs_cuda(*_scaleogram_inputs())
+
+
 @pytest.mark.parametrize("input1, input2, expected", [
     (4, np.inf, ['LAMY 7', 'RAHP 3']),
     (3, 2, ['LAMY 7', 'LPHG 6', 'LBRI 3', 'RAHP 3', 'LENT 3', 'LPIT 5'])
@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
 
-from ieeg.calc.mat import LabeledArray, Labels, combine, iter_nest_dict
+from ieeg.calc.mat import LabeledArray, Labels, combine, inner_array, \
+    iter_nest_dict
 from ieeg.calc.fast import concatenate_arrays
 
 
@@ -48,6 +49,12 @@ from ieeg.calc.fast import concatenate_arrays
      np.array([[np.nan, np.nan, np.nan], [np.nan, np.nan, np.nan],
                [5, 6, 7], [8, 9, 10]])),
 
+    # Test case 10: Concatenate along axis 2 with padding on axes 0 and 1
+    ((np.array([[[0], [1]], [[2], [3]]]), np.array([[[4, 5]]])),
+     2,
+     np.array([[[0, 4, 5], [1, np.nan, np.nan]],
+               [[2, np.nan, np.nan], [3, np.nan, np.nan]]])),
+
     # Test case 9: Concatenate along new axis
     # ((np.array([[1, 2], [3, 4]]), np.array([[5, 6, 7], [8, 9, 10]])),
     #     None,
@@ -109,6 +116,13 @@ def test_parse_index(index, expected):
     assert parsed == expected
 
 
+@pytest.mark.parametrize('key', [{'a': 0}, np.array([0.5, 1.])])
+def test_parse_index_bad_key(key):
+    ad = LabeledArray([[1, 2]], labels=[('a',), ('b', 'c')])
+    with pytest.raises(TypeError, match="Unexpected key type"):
+        ad._parse_index([key])
+
+
 # Test getting all keys
 def test_array_all_keys():
     data = {'a': {'b': {'c': 1, 'd': 2, 'e': 3}, 'f': {'c': 4, 'd': 5}}}
@@ -204,6 +218,22 @@ def test_from_dict():
     assert ad == expected_array
 
 
+@pytest.mark.parametrize('data, expected', [
+    ({'a': {'b': [1, 2]}}, [[[1., 2.]]]),
+    ({'a': [1, 2], 'b': [3]}, [[1., 2.], [3., np.nan]]),
+])
+def test_inner_array_list_leaf(data, expected):
+    np.testing.assert_array_equal(inner_array(data), np.array(expected))
+
+
+def test_from_dict_key_order():
+    data = {'a': {'b': {'e': 1}}, 'd': {'b': {'c': 2, 'e': 3}}}
+    ad = LabeledArray.from_dict(data)
+    assert ad['d', 'b', 'c'] == 2
+    assert ad['d', 'b', 'e'] == 3
+    assert np.isnan(ad['a', 'b', 'c'])
+
+
 def test_eq():
     data1 = {'a': {'b': {'c': 1}}}
     ad1 = LabeledArray.from_dict(data1)
@@ -241,6 +271,9 @@ def test_numpy_idx(idx):
 
 
 @pytest.mark.parametrize('idx, expected', [
+    (0, (('b',), ('c', 'd'))),
+    (slice(None), (('a',), ('b',), ('c', 'd'))),
+    ('a', (('b',), ('c', 'd'))),
     ((0,), (('b',), ('c', 'd'))),
     ((0, 0), (('c', 'd'),)),
     ((..., 0, 0), (('a',),)),
@@ -269,3 +302,37 @@ def test_set_array_val(idx, val, expected):
     ad = LabeledArray([[[1, 2]]], labels=[('a',), ('b',), ('c', 'd')])
     ad[idx] = val
     np.testing.assert_array_equal(ad.__array__(), np.array(expected))
+
+
+@pytest.mark.parametrize('write', [
+    lambda lab: lab.__setitem__(1, 'd'),
+    lambda lab: lab[1:].__setitem__(0, 'd'),
+    lambda lab: lab.view(np.ndarray).__setitem__(1, 'd'),
+    lambda lab: np.copyto(lab, ['a', 'd', 'c']),
+])
+def test_labels_lookup_after_write(write):
+    ad = LabeledArray([1, 2, 3], labels=[('a', 'b', 'c')])
+    labels = ad.labels[0]
+    assert labels.find('b') == 1
+    write(labels)
+    assert labels.find('d') == 1
+    assert ad['d'] == 2
+    np.testing.assert_array_equal(ad[(['d', 'c'],)], [2, 3])
+    with pytest.raises(IndexError):
+        labels.find('b')
+
+
+@pytest.mark.parametrize('func, expected', [
+    (lambda x: np.sum(x, axis=(2, 1)), (('a', 'b'),)),
+    (lambda x: np.sum(x, axis=(-1, 0)), (('c', 'd', 'e'),)),
+    (lambda x: np.add.reduce(x), (('c', 'd', 'e'), ('f', 'g'))),
+    (lambda x: np.mean(x, axis=(2, 1), keepdims=True),
+     (('a', 'b'), ('c-d-e',), ('f-g',))),
+])
+def test_reduce_labels(func, expected):
+    ad = LabeledArray(np.arange(12.).reshape(2, 3, 2),
+                      labels=[('a', 'b'), ('c', 'd', 'e'), ('f', 'g')])
+    out = func(ad)
+    assert len(out.labels) == len(expected)
+    assert all((out.labels[i] == Labels(ex)).all()
+               for i, ex in enumerate(expected))